@@ -2,13 +2,32 @@
 from __future__ import annotations
 
 import decimal
+import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime, timedelta
-from functools import cache
-from typing import Any, List, get_args
+from functools import cache, cached_property
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    cast,
+    get_args,
+)
 from urllib.parse import urlparse
 
+import orjson
+import requests
 import singer_sdk._singerlib as singer
 from requests import Response
+from requests.adapters import HTTPAdapter
+from singer_sdk import metrics
+from singer_sdk._singerlib.messages import format_message
 from singer_sdk.authenticators import APIKeyAuthenticator
 from singer_sdk.pagination import BaseAPIPaginator
 from singer_sdk.plugin_base import PluginBase as TapBaseClass
@@ -16,6 +35,20 @@ from singer_sdk.streams import RESTStream
 
 from .model import BASE_METRICS, DIMENSIONS, ReportModel
 
+if TYPE_CHECKING:
+    from .tap import TapAdjust
+
+DIMENSIONS_SET = frozenset(get_args(DIMENSIONS))
+BASE_METRICS_SET = frozenset(get_args(BASE_METRICS))
+
+REPORT_SCHEMA = ReportModel.schema()
+
+# Python types used to coerce the string values returned by the API, by JSON schema type
+JSON_TYPE_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "integer": int,
+    "number": decimal.Decimal,
+}
+
 
 class AdjustStream(RESTStream):
     """Adjust REST stream class."""
@@ -37,22 +70,45 @@ class AdjustStream(RESTStream):
             location="header",
         )
 
+    @property
+    def max_concurrency(self: AdjustStream) -> int:
+        """Return the maximum number of requests in flight.
+
+        Returns:
+            Maximum number of concurrent requests.
+        """
+        return self.config.get("max_concurrency") or 4
+
+    @cached_property
+    def requests_session(self: AdjustStream) -> requests.Session:
+        """Get a requests session with a connection pool sized for concurrent requests.
+
+        Returns:
+            The `requests.Session`_ object for HTTP requests.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_concurrency, pool_maxsize=self.max_concurrency)
+        session.mount("https://", adapter)
+        return session
+
 
 # A paginator that returns a list of dates between start_date and end_date
-class DatePaginator(BaseAPIPaginator[datetime.date]):
-    """Paginates data day by day."""
+class DatePaginator(BaseAPIPaginator[date]):
+    """Paginates data in windows of `batch_days` days."""
 
-    def __init__(self: DatePaginator, start_value: date, end_value: date) -> None:
+    def __init__(self: DatePaginator, start_value: date, end_value: date, batch_days: int = 1) -> None:
         """
         Create a new paginator.
 
         Args:
             start_value: Initial value.
-            end_value: End date value.
+            end_value: Last date to query, inclusive.
+            batch_days: Number of days covered by each page.
         """
         super().__init__(start_value)
         self._start_value = start_value
         self._end_value = end_value
+        self._step = timedelta(days=batch_days)
 
     def has_more(self: DatePaginator, response: Response) -> bool:
         """Override this method to check if the endpoint has any pages left.
@@ -64,7 +120,7 @@ class DatePaginator(BaseAPIPaginator[datetime.date]):
             Boolean flag used to indicate if the endpoint has more pages.
         """
         # return False
-        return self.current_value < min(self._end_value, datetime.utcnow().date())
+        return self.current_value + self._step <= self._end_value
 
     def get_next(self: DatePaginator, response: Response) -> date | None:
         """Get the next pagination token or index from the API response.
@@ -76,16 +132,29 @@ class DatePaginator(BaseAPIPaginator[datetime.date]):
             The next page token or index. Return `None` from this method to indicate
                 the end of pagination.
         """
-        next_date = self._start_value + timedelta(days=self.count)
+        next_date = self._start_value + self._step * self.count
         # self.logger.info("Next Date to query: %s", next_date)
         return next_date
 
+    def remaining_values(self: DatePaginator) -> Iterator[date]:
+        """Iterate over the start dates of the pages left to query.
+
+        Pages don't depend on API responses, so they can be computed upfront.
+
+        Yields:
+            The start date of every remaining page.
+        """
+        value = self.current_value
+        yield value
+        while value + self._step <= self._end_value:
+            value += self._step
+            yield value
+
 
 class ReportStream(AdjustStream):
     """Adjust report stream class."""
 
     name = "report"
-    records_jsonpath = "$.rows[*]"
     path = "/control-center/reports-service/report"
     replication_key = "day"
     replication_method = "INCREMENTAL"
@@ -106,31 +175,107 @@ class ReportStream(AdjustStream):
         self.dimensions: List[str] = []
         self.metrics: List[str] = []
 
-    @property
+        # Unfortunately all fields are returned as strings by the API, so build a table
+        # of converters once from the JSON schema instead of inspecting the model for
+        # every field of every row
+        self._converters: Dict[str, Optional[Callable[[Any], Any]]] = {
+            name: JSON_TYPE_CONVERTERS.get(prop.get("type")) for name, prop in self.schema["properties"].items()
+        }
+
+        self._base_params = self._build_base_params()
+        # until a catalog is applied, convert every field in the schema
+        self._reshape: Callable[[dict], dict] = self._compile_reshape(list(self._converters))
+
+    @cached_property
     def schema(self: ReportStream) -> dict:
         """Get schema.
 
+        Additional metrics come from the config, so the schema is only built once.
+
         Returns:
             JSON Schema dictionary for this stream.
         """
-        schema = ReportModel.schema()
-        properties = schema["properties"]
+        # copy the shared base schema so that additional metrics don't leak between streams
+        properties = dict(REPORT_SCHEMA["properties"])
 
-        for attr in self.config["additional_metrics"]:
+        for attr in self.config.get("additional_metrics") or []:
             properties[attr] = {"type": "number"}
 
-        return schema
+        return {**REPORT_SCHEMA, "properties": properties}
 
-    def get_new_paginator(self: ReportStream) -> BaseAPIPaginator:
+    def get_new_paginator(self: ReportStream) -> DatePaginator:
         """Get a fresh paginator for this API endpoint.
 
         Returns:
             A paginator instance.
         """
-        return DatePaginator(
-            datetime.strptime(self.config["start_date"], "%Y-%m-%d").date(),
-            datetime.strptime(self.config["end_date"], "%Y-%m-%d").date(),
-        )
+        return DatePaginator(cast("TapAdjust", self._tap).start_date, self.end_date, self.batch_days)
+
+    @cached_property
+    def end_date(self: ReportStream) -> date:
+        """Return the last date to query, which is never past the current UTC date.
+
+        Returns:
+            The effective end date.
+        """
+        return min(cast("TapAdjust", self._tap).end_date, datetime.utcnow().date())
+
+    @property
+    def batch_days(self: ReportStream) -> int:
+        """Return the number of days to request at once.
+
+        Returns:
+            Number of days covered by each request.
+        """
+        return self.config.get("batch_days") or 7
+
+    def request_records(self: ReportStream, context: dict | None) -> Iterable[dict]:
+        """Request records from the API, fetching several date windows concurrently.
+
+        Date tokens don't depend on previous responses, so they're computed upfront
+        and at most `max_concurrency` requests are kept in flight. Records are
+        yielded in the same order as the date windows.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Yields:
+            An item for every record in the response.
+        """
+        tokens = self.get_new_paginator().remaining_values()
+        decorated_request = self.request_decorator(self._request)
+
+        def fetch(token: date) -> tuple[requests.PreparedRequest, Response]:
+            prepared_request = self.prepare_request(context, next_page_token=token)
+            return prepared_request, decorated_request(prepared_request, context)
+
+        with metrics.http_request_counter(self.name, self.path) as request_counter:
+            request_counter.context = context
+
+            executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+            pending: deque[Future] = deque()
+            try:
+                for token in tokens:
+                    pending.append(executor.submit(fetch, token))
+                    if len(pending) >= self.max_concurrency:
+                        yield from self._handle_future(pending.popleft(), request_counter, context)
+
+                while pending:
+                    yield from self._handle_future(pending.popleft(), request_counter, context)
+            finally:
+                # on errors or when the generator is closed early, don't wait for (or start)
+                # the remaining requests before propagating
+                for future in pending:
+                    future.cancel()
+                executor.shutdown(wait=False)
+
+    def _handle_future(
+        self: ReportStream, future: Future, request_counter: metrics.Counter, context: dict | None
+    ) -> Iterable[dict]:
+        prepared_request, resp = future.result()
+        request_counter.increment()
+        self.update_sync_costs(prepared_request, resp, context)
+        yield from self.parse_response(resp)
 
     @property
     def primary_keys(self: ReportStream) -> List[str]:
@@ -163,23 +308,36 @@ class ReportStream(AdjustStream):
         Returns:
             Dictionary of URL query parameters to use in the request.
         """
-        request_params = {
-            # query data day by day
-            "date_period": f"{next_page_token}:{next_page_token}",
+        window_start = cast(date, next_page_token)
+
+        # rows are still returned per day since `day` is always a dimension.
+        # The first window is always requested, even if it starts after the end date.
+        window_end = max(min(window_start + timedelta(days=self.batch_days - 1), self.end_date), window_start)
+        request_params = {**self._base_params, "date_period": f"{window_start}:{window_end}"}
+
+        self.logger.debug("Request params: %s", request_params)
+
+        return request_params
+
+    def _build_base_params(self: ReportStream) -> dict[str, Any]:
+        # these don't change between pages, so they're only computed once the
+        # dimensions and metrics are known
+        base_params = {
             "dimensions": ",".join(self.dimensions),
-            "metrics": ",".join(self.metrics),
             "attribution_type": self.config.get("attribution_type", "click"),
             "attribution_source": self.config.get("attribution_source", "dynamic"),
         }
 
+        # only request the metrics that were selected, if any
+        if self.metrics:
+            base_params["metrics"] = ",".join(self.metrics)
+
         currency = self.config.get("currency")
 
         if currency:
-            request_params["currency"] = currency
+            base_params["currency"] = currency
 
-        self.logger.info("Request params: %s", request_params)
-
-        return request_params
+        return base_params
 
     def apply_catalog(self: ReportStream, catalog: singer.Catalog) -> None:
         """Extract the dimensions and metrics from the catalog.
@@ -190,18 +348,21 @@ class ReportStream(AdjustStream):
         catalog_entry = catalog.get_stream(self.name)
         selection = catalog_entry.metadata.resolve_selection()
 
+        # custom metrics passed in config are only requested when selected too
+        additional_metrics = set(self.config.get("additional_metrics") or [])
+
         for breadcrumb, selected in selection.items():
             if breadcrumb and selected:
-                if breadcrumb[-1] in get_args(DIMENSIONS):
-                    self.dimensions.append(breadcrumb[-1])
-                elif breadcrumb[-1] in get_args(BASE_METRICS):
-                    self.metrics.append(breadcrumb[-1])
+                name = breadcrumb[-1]
+                if name in DIMENSIONS_SET:
+                    self.dimensions.append(name)
+                elif name in BASE_METRICS_SET or name in additional_metrics:
+                    self.metrics.append(name)
 
         if "day" not in self.dimensions:
             self.dimensions.append("day")
 
-        # # add custom metrics passed in config
-        self.metrics = list(set(self.metrics + self.config["additional_metrics"]))
+        self.metrics = list(dict.fromkeys(self.metrics))
 
         catalog_entry.key_properties = self.dimensions
         catalog_entry.metadata.root.table_key_properties = catalog_entry.key_properties
@@ -209,6 +370,9 @@ class ReportStream(AdjustStream):
         self.logger.info("Selected dimensions: %s", self.dimensions)
         self.logger.info("Selected metrics: %s", self.metrics)
 
+        self._base_params = self._build_base_params()
+        self._reshape = self._compile_reshape(self.dimensions + self.metrics)
+
         super().apply_catalog(catalog)
 
         # mapper doesn't work with dynamic primary keys
@@ -216,24 +380,43 @@ class ReportStream(AdjustStream):
         # and use that as the primary key instead of the set of selected dimensions
         self._tap.mapper.register_raw_streams_from_catalog(catalog)
 
-    def _reshape(self: ReportStream, row: dict) -> dict | None:
-        model = ReportModel.__dict__["__fields__"]
-        row.pop("attr_dependency", None)
-        # Unfortunately all fields are returned as strings by the API
-        for k, v in list(row.items()):
-            if k in model:
-                type_ = model[k].type_
-            else:  # Additional user-provided metrics are assumed to be decimal
-                type_ = decimal.Decimal
-            if type_ in (int, decimal.Decimal):
-                try:
-                    row[k] = type_(v)
-                except TypeError:
-                    self.logger.warning(
-                        "Unable to convert field '%s': %s to %s, leaving '%s' as is", k, v, type_.__name__, k
-                    )
-
-        return row
+    def _warn_conversion(self: ReportStream, k: str, v: Any, converter: Callable[[Any], Any]) -> None:
+        self.logger.warning("Unable to convert field '%s': %s to %s, leaving '%s' as is", k, v, converter.__name__, k)
+
+    def _compile_reshape(self: ReportStream, fields: List[str]) -> Callable[[dict], dict]:
+        # The fields are fixed once the catalog is applied, so generate a straight-line
+        # function with one conversion per field instead of looking up converters for
+        # every field of every row. Fields without a converter are left as is.
+        namespace: Dict[str, Any] = {"_warn": self._warn_conversion, "InvalidOperation": decimal.InvalidOperation}
+        lines = ["def _reshape(row):", "    row.pop('attr_dependency', None)"]
+        for i, field in enumerate(fields):
+            converter = self._converters.get(field)
+            if converter is None:
+                continue
+            namespace[f"_c{i}"] = converter
+            lines += [
+                f"    if {field!r} in row:",
+                "        try:",
+                f"            row[{field!r}] = _c{i}(row[{field!r}])",
+                "        except (TypeError, ValueError, InvalidOperation):",
+                f"            _warn({field!r}, row[{field!r}], _c{i})",
+            ]
+        lines.append("    return row")
+
+        exec("\n".join(lines), namespace)
+        return namespace["_reshape"]
+
+    def parse_response(self: ReportStream, response: Response) -> Iterable[dict]:
+        """Parse the response and return an iterator of result records.
+
+        Args:
+            response: A raw `requests.Response`_ object.
+
+        Yields:
+            One item for every item found in the response.
+        """
+        # records are always nested under a top-level `rows` key, no need for JSONPath
+        yield from orjson.loads(response.content).get("rows") or []
 
     def post_process(self: ReportStream, row: dict, context: dict | None = None) -> dict | None:
         """Post process a row.
@@ -247,6 +430,12 @@ class ReportStream(AdjustStream):
         """
         return self._reshape(row)
 
+    def _write_record_message(self: ReportStream, record: dict) -> None:
+        # singer.write_message flushes stdout after every message, which is a syscall per row.
+        # Let stdout buffer records instead; the next STATE message flushes them.
+        for record_message in self._generate_record_messages(record):
+            sys.stdout.write(format_message(record_message) + "\n")
+
     def response_error_message(self: ReportStream, response: Response) -> str:
         """Build error message for invalid http statuses.
 
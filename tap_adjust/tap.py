@@ -1,6 +1,8 @@
 """Adjust tap class."""
+from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
+from functools import cached_property
 from typing import List
 
 from singer_sdk import Stream, Tap
@@ -23,11 +25,48 @@ class TapAdjust(Tap):
         th.Property(
             "end_date",
             th.DateType,
-            default=str(datetime.utcnow().date()),
             required=False,
+            description="Defaults to the current UTC date.",
+        ),
+        th.Property(
+            "batch_days",
+            th.IntegerType,
+            default=7,
+            required=False,
+            description="Number of days to fetch in a single request.",
+        ),
+        th.Property(
+            "max_concurrency",
+            th.IntegerType,
+            default=4,
+            required=False,
+            description="Maximum number of requests to run concurrently.",
         ),
     ).to_dict()
 
+    # the SDK typing helpers can't express bounds, so add them to the generated schema
+    config_jsonschema["properties"]["batch_days"]["minimum"] = 1
+    config_jsonschema["properties"]["max_concurrency"]["minimum"] = 1
+
+    @cached_property
+    def start_date(self: TapAdjust) -> date:
+        """Return the parsed start date.
+
+        Returns:
+            The configured start date.
+        """
+        return date.fromisoformat(self.config["start_date"])
+
+    @cached_property
+    def end_date(self: TapAdjust) -> date:
+        """Return the parsed end date, defaulting to the current UTC date.
+
+        Returns:
+            The configured end date.
+        """
+        end_date = self.config.get("end_date")
+        return date.fromisoformat(end_date) if end_date else datetime.utcnow().date()
+
     def discover_streams(self: Tap) -> List[Stream]:
         """Return a list of discovered streams.
 
@@ -0,0 +1,305 @@
+"""Tests for the report stream."""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+import threading
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import orjson
+import pytest
+from requests import Response
+from singer_sdk.exceptions import ConfigValidationError, FatalAPIError
+
+from tap_adjust.streams import DatePaginator, ReportStream
+from tap_adjust.tap import TapAdjust
+
+BASE_CONFIG = {
+    "api_token": "test-token",
+    "attribution_type": "click",
+    "attribution_source": "dynamic",
+    "start_date": "2023-01-01",
+    "end_date": "2023-01-10",
+}
+
+# upper bound for waits in the concurrency tests, only reached if a test fails
+TIMEOUT = 5
+
+
+def get_stream(**config: object) -> ReportStream:
+    """Create a report stream for a tap with the given config overrides.
+
+    Args:
+        config: Settings to override in the base config.
+
+    Returns:
+        The report stream instance.
+    """
+    tap = TapAdjust(config={**BASE_CONFIG, **config}, parse_env_config=False)
+    return tap.streams["report"]  # type: ignore[return-value]
+
+
+def make_response(prepared_request: object, rows: list[dict]) -> Response:
+    """Build a successful API response holding the given rows.
+
+    Args:
+        prepared_request: The request being answered.
+        rows: Report rows to return.
+
+    Returns:
+        The response object.
+    """
+    response = Response()
+    response.status_code = 200
+    response.url = prepared_request.url  # type: ignore[attr-defined]
+    response._content = orjson.dumps({"rows": rows})
+    return response
+
+
+def window_start(prepared_request: object) -> str:
+    """Get the first day of the date window requested.
+
+    Args:
+        prepared_request: The request sent to the API.
+
+    Returns:
+        The window start date as an ISO string.
+    """
+    query = parse_qs(urlparse(prepared_request.url).query)  # type: ignore[attr-defined]
+    return query["date_period"][0].split(":")[0]
+
+
+def test_paginator_windows() -> None:
+    """Pages start every `batch_days` days until the end date."""
+    paginator = DatePaginator(datetime.date(2023, 1, 1), datetime.date(2023, 1, 10), batch_days=7)
+
+    values = []
+    while not paginator.finished:
+        values.append(paginator.current_value)
+        paginator.advance(Response())
+
+    assert values == [datetime.date(2023, 1, 1), datetime.date(2023, 1, 8)]
+    assert list(DatePaginator(datetime.date(2023, 1, 1), datetime.date(2023, 1, 10), 7).remaining_values()) == values
+
+
+def test_paginator_single_day_windows() -> None:
+    """With one day per page, every day is its own page."""
+    paginator = DatePaginator(datetime.date(2023, 1, 1), datetime.date(2023, 1, 3), batch_days=1)
+
+    assert list(paginator.remaining_values()) == [
+        datetime.date(2023, 1, 1),
+        datetime.date(2023, 1, 2),
+        datetime.date(2023, 1, 3),
+    ]
+
+
+def test_date_period_windows() -> None:
+    """Each request covers a window, and the last one stops at the end date."""
+    stream = get_stream(batch_days=7)
+
+    assert stream.get_url_params(None, datetime.date(2023, 1, 1))["date_period"] == "2023-01-01:2023-01-07"
+    assert stream.get_url_params(None, datetime.date(2023, 1, 8))["date_period"] == "2023-01-08:2023-01-10"
+
+
+def test_date_period_not_past_today() -> None:
+    """A future end date is clamped to the current day."""
+    today = datetime.datetime.utcnow().date()
+    stream = get_stream(end_date=str(today + datetime.timedelta(days=30)), batch_days=7)
+
+    assert stream.get_url_params(None, today)["date_period"] == f"{today}:{today}"
+    assert list(stream.get_new_paginator().remaining_values())[-1] <= today
+
+
+def test_date_period_start_after_end() -> None:
+    """A start date after the end date requests that single day."""
+    stream = get_stream(start_date="2023-02-01", batch_days=7)
+
+    tokens = list(stream.get_new_paginator().remaining_values())
+
+    assert tokens == [datetime.date(2023, 2, 1)]
+    assert stream.get_url_params(None, tokens[0])["date_period"] == "2023-02-01:2023-02-01"
+
+
+@pytest.mark.parametrize("batch_days", [0, -1])
+def test_invalid_batch_days(batch_days: int) -> None:
+    """Batch sizes below one day are rejected.
+
+    Args:
+        batch_days: Invalid batch size.
+    """
+    with pytest.raises(ConfigValidationError):
+        get_stream(batch_days=batch_days)
+
+
+def test_request_records_order_and_concurrency() -> None:
+    """Windows are fetched concurrently, up to the limit, and yielded in date order."""
+    stream = get_stream(end_date="2023-01-06", batch_days=1, max_concurrency=3)
+    days = [f"2023-01-0{i}" for i in range(1, 7)]
+    started = {day: threading.Event() for day in days}
+    released = {day: threading.Event() for day in days}
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def request(prepared_request: object, context: dict | None) -> Response:
+        nonlocal in_flight, max_in_flight
+        day = window_start(prepared_request)
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        started[day].set()
+        released[day].wait(TIMEOUT)
+        with lock:
+            in_flight -= 1
+        return make_response(prepared_request, [{"day": day}])
+
+    records: list[dict] = []
+    with mock.patch.object(ReportStream, "_request", side_effect=request):
+        consumer = threading.Thread(target=lambda: records.extend(stream.request_records(None)))
+        consumer.start()
+
+        # the first three windows are in flight at the same time, answer them in reverse order
+        for day in days[:3]:
+            assert started[day].wait(TIMEOUT)
+        for day in reversed(days[:3]):
+            released[day].set()
+
+        for day in days[3:]:
+            assert started[day].wait(TIMEOUT)
+        for day in reversed(days[3:]):
+            released[day].set()
+
+        consumer.join(TIMEOUT)
+
+    assert not consumer.is_alive()
+    assert [record["day"] for record in records] == days
+    assert max_in_flight == 3
+
+
+def test_request_records_error() -> None:
+    """A failed request stops the sync without waiting for the other requests."""
+    stream = get_stream(end_date="2023-01-04", batch_days=1, max_concurrency=4)
+    others = ["2023-01-02", "2023-01-03", "2023-01-04"]
+    started = {day: threading.Event() for day in others}
+    finished = {day: threading.Event() for day in others}
+    release = threading.Event()
+
+    def request(prepared_request: object, context: dict | None) -> Response:
+        day = window_start(prepared_request)
+        if day == "2023-01-01":
+            # fail once the other requests are in flight
+            for event in started.values():
+                event.wait(TIMEOUT)
+            raise FatalAPIError("failed")
+        started[day].set()
+        release.wait(TIMEOUT)
+        finished[day].set()
+        return make_response(prepared_request, [])
+
+    with mock.patch.object(ReportStream, "_request", side_effect=request):
+        try:
+            with pytest.raises(FatalAPIError):
+                list(stream.request_records(None))
+
+            assert all(event.is_set() for event in started.values())
+            assert not any(event.is_set() for event in finished.values())
+        finally:
+            release.set()
+
+
+def get_selected_stream(selected: tuple[str, ...], **config: object) -> ReportStream:
+    """Create a report stream with only the given fields selected in its catalog.
+
+    Args:
+        selected: Names of the fields to select.
+        config: Settings to override in the base config.
+
+    Returns:
+        The report stream instance.
+    """
+    config = {**BASE_CONFIG, **config}
+    catalog = TapAdjust(config=config, parse_env_config=False).catalog_dict
+    for entry in catalog["streams"][0]["metadata"]:
+        if entry["breadcrumb"]:
+            entry["metadata"]["selected"] = entry["breadcrumb"][-1] in selected
+
+    tap = TapAdjust(config=config, catalog=catalog, parse_env_config=False)
+    return tap.streams["report"]  # type: ignore[return-value]
+
+
+def test_selected_metrics() -> None:
+    """Only metrics selected in the catalog are requested, including additional metrics."""
+    stream = get_selected_stream(("country", "installs", "custom"), additional_metrics=["custom", "deselected"])
+
+    assert stream.metrics == ["installs", "custom"]
+    assert stream._base_params["metrics"] == "installs,custom"
+    assert stream._base_params["dimensions"] == "country,day"
+
+
+def test_no_selected_metrics() -> None:
+    """The metrics parameter is omitted when no metrics are selected."""
+    stream = get_selected_stream(("country",), additional_metrics=["custom"])
+
+    assert stream.metrics == []
+    assert "metrics" not in stream.get_url_params(None, datetime.date(2023, 1, 1))
+
+
+def test_reshape_without_catalog() -> None:
+    """Rows are converted using the schema types when no catalog is applied."""
+    stream = get_stream(additional_metrics=["custom"])
+
+    row = stream.post_process(
+        {
+            "day": "2023-01-01",
+            "installs": "3",
+            "cost": "1.25",
+            "custom": "2.5",
+            "unknown": "x",
+            "attr_dependency": {"campaign_id_network": "1"},
+        }
+    )
+
+    assert row == {
+        "day": "2023-01-01",
+        "installs": 3,
+        "cost": decimal.Decimal("1.25"),
+        "custom": decimal.Decimal("2.5"),
+        "unknown": "x",
+    }
+
+
+def test_reshape_selected_fields() -> None:
+    """Only the fields selected in the catalog are converted."""
+    stream = get_selected_stream(("country", "installs"))
+
+    row = stream.post_process({"day": "2023-01-01", "country": "Germany", "installs": "3", "attr_dependency": {}})
+
+    assert row == {"day": "2023-01-01", "country": "Germany", "installs": 3}
+
+
+@pytest.mark.parametrize(
+    "field,value",
+    [
+        ("installs", None),
+        ("installs", ""),
+        ("installs", "1.0"),
+        ("cost", "n/a"),
+    ],
+)
+def test_reshape_conversion_warning(field: str, value: str | None) -> None:
+    """Values that can't be converted are left as is and logged.
+
+    Args:
+        field: Name of the field to convert.
+        value: Value that can't be converted.
+    """
+    stream = get_stream()
+
+    with mock.patch.object(stream.logger, "warning") as warning:
+        row = stream.post_process({"day": "2023-01-01", field: value})
+
+    assert row == {"day": "2023-01-01", field: value}
+    warning.assert_called_once()
+    assert warning.call_args.args[1:3] == (field, value)